@@ -1,19 +1,455 @@
+import csv
+import heapq
+import itertools
+import mmap
+import numbers
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; edge sorting falls back to sorted()
+    np = None
+
+
+# Below this many edges a Borůvka process pool costs more than it saves
+BORUVKA_PARALLEL_THRESHOLD = 200_000
+
+# Binary graph file: header, then the int64/float64 sections edge_u, edge_v,
+# edge_w, offsets, neighbors, weights, then the node names (UTF-8, NUL-separated)
+GRAPH_MAGIC = b"GRPH"
+GRAPH_VERSION = 1
+_GRAPH_HEADER = struct.Struct("=4sHcc3q")  # magic, version, byte order, weight type, V, E, name bytes
+# Hub label index file: header, then int64 offsets, int64 hubs and the distances
+LABELS_MAGIC = b"HUBL"
+LABELS_VERSION = 1
+_LABELS_HEADER = struct.Struct("=4sHcc2q")  # magic, version, byte order, distance type, V, entries
+
+
+def typecode_of(values):
+    """Element type code of an array.array or a memoryview cast from a file"""
+    return values.typecode if isinstance(values, array) else values.format
+
+
+def as_array(values):
+    """values as a writable array.array (copies a read-only memoryview)"""
+    if isinstance(values, array):
+        return values
+    return array(values.format, values.tobytes())
+
+
+def argsort_weights(weights):
+    """
+    Edge positions ordered by weight (stable), without reordering the weights.
+    Uses NumPy's vectorized argsort when available.
+    :param weights: typed array of edge weights
+    :return: list of edge indices, lightest edge first
+    """
+    if np is not None and len(weights):
+        return np.argsort(np.frombuffer(weights, dtype=typecode_of(weights)), kind="stable").tolist()
+    return sorted(range(len(weights)), key=weights.__getitem__)
+
+
+def cheapest_edges(edge_u, edge_v, edge_w, component, lo, hi):
+    """
+    Borůvka step for the edges lo..hi-1: the cheapest edge leaving each component.
+    Ties are broken by edge index so every component picks a consistent edge
+    and no cycle can form.
+    :return: dict component -> edge index
+    """
+    best = {}
+    for i in range(lo, hi):
+        cu = component[edge_u[i]]
+        cv = component[edge_v[i]]
+        if cu == cv:
+            continue
+        w = edge_w[i]
+        for c in (cu, cv):
+            j = best.get(c)
+            if j is None or w < edge_w[j] or (w == edge_w[j] and i < j):
+                best[c] = i
+    return best
+
+
+_worker_edges = None  # edge arrays, sent once to every Borůvka worker process
+
+
+def _init_boruvka_worker(edge_u, edge_v, edge_w):
+    global _worker_edges
+    _worker_edges = (edge_u, edge_v, edge_w)
+
+
+def _cheapest_edges_worker(component, lo, hi):
+    return cheapest_edges(*_worker_edges, component, lo, hi)
+
+
+class DisjointSet:
+    """
+    Union-Find (Disjoint Set Union) over the elements 0..n-1.
+    parent and size are compact typed arrays. find() uses iterative path
+    halving and union() links the smaller set under the larger (union by size),
+    so both take near-constant amortized time and never recurse.
+    """
+    def __init__(self, n):
+        self.parent = array("q", range(n))
+        self.size = array("q", [1]) * n
+        self.components = n  # number of disjoint sets
+
+    def find(self, x):
+        """Representative (root) of the set containing x"""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving: skip to the grandparent
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Merge the sets of x and y; return True if they were different sets"""
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return False
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        self.components -= 1
+        return True
+
+    def connected(self, x, y):
+        """True if x and y are in the same set"""
+        return self.find(x) == self.find(y)
+
+    def union_many(self, xs, ys):
+        """Union every pair (xs[i], ys[i]); return how many merges happened"""
+        merges = 0
+        for x, y in zip(xs, ys):
+            if self.union(x, y):
+                merges += 1
+        return merges
+
+    def find_many(self, xs=None):
+        """Roots of every x in xs (of all elements when xs is None) as an array"""
+        if xs is None:
+            xs = range(len(self.parent))
+        return array("q", [self.find(x) for x in xs])
+
+    def labels(self):
+        """
+        Number every set 0, 1, 2, ... in order of its first element.
+        :return: (number of sets, array with the set label of every element)
+        """
+        label_of_root = {}
+        labels = array("q", [0]) * len(self.parent)
+        for x, root in enumerate(self.find_many()):
+            labels[x] = label_of_root.setdefault(root, len(label_of_root))
+        return len(label_of_root), labels
+
+
 class Graph:
     def __init__(self, vertices):
         self.V = vertices
-        self.graph = []  # For Kruskal (Edge List)
-        self.adj_matrix = [[0 for _ in range(vertices)] for _ in range(vertices)]
+        # Edge list stored as parallel typed arrays (For Kruskal)
+        self.edge_u = array("q")
+        self.edge_v = array("q")
+        self.edge_w = array("q")  # becomes a float array once a float weight is added
         self.node_names = []
+        self.name_to_id = {}  # reverse index of node_names
+        self._csr = None    # (offsets, neighbors, weights), rebuilt after changes
+        self._dense = None  # V x V matrix, only materialized on request
+        self._adj_list = None  # cached name-keyed adjacency list
+        self._mmap = None   # file mapping backing the arrays of an opened binary graph
+
+    @property
+    def graph(self):
+        """
+        Read-only snapshot of the edge list as a tuple of (u, v, w) tuples.
+        This used to be a mutable list of [u, v, w] lists; edges are now stored
+        in edge_u / edge_v / edge_w, so use add_edge or add_edges to change them.
+        """
+        return tuple(zip(self.edge_u, self.edge_v, self.edge_w))
 
     def add_node_names(self, names):
-        """Assign human-readable names to vertices."""
+        """Assign human-readable names to vertices (names must be unique)."""
+        name_to_id = {}
+        for i, name in enumerate(names):
+            if name in name_to_id:
+                raise ValueError(f"duplicate node name {name!r}")
+            name_to_id[name] = i
         self.node_names = names
+        self.name_to_id = name_to_id
+        self._adj_list = None
+
+    def vertex_id(self, vertex):
+        """Integer id of a vertex given by name (ids are returned unchanged): O(1)"""
+        if isinstance(vertex, int):
+            return vertex
+        return self.name_to_id[vertex]  # KeyError for an unknown name
+
+    def neighbors(self, vertex):
+        """(neighbor id, weight) pairs of a vertex given by id or name: O(degree)"""
+        offsets, neighbors, weights = self.csr()
+        u = self.vertex_id(vertex)
+        start, end = offsets[u], offsets[u + 1]
+        return list(zip(neighbors[start:end], weights[start:end]))
 
     def add_edge(self, u, v, w):
         """Add edge between node u and v with weight w"""
-        self.graph.append([u, v, w])
-        self.adj_matrix[u][v] = w
-        self.adj_matrix[v][u] = w
+        if not (0 <= u < self.V and 0 <= v < self.V):
+            raise IndexError(f"edge ({u}, {v}) has a vertex outside 0..{self.V - 1}")
+        if self._mmap is not None:
+            # Copy-on-write: the memory-mapped file itself is read-only
+            self.edge_u, self.edge_v, self.edge_w = map(as_array, (self.edge_u, self.edge_v, self.edge_w))
+            self._mmap = None
+        if self.edge_w.typecode == "q" and not isinstance(w, numbers.Integral):
+            self.edge_w = array("d", self.edge_w)
+        self.edge_w.append(w)
+        self.edge_u.append(u)
+        self.edge_v.append(v)
+        self._invalidate()
+
+    def add_edges(self, edges):
+        """
+        Bulk-load an iterable of (u, v, w) edges in one pass.
+        Parallel edges (the same pair of vertices in either direction, including
+        edges already in the graph) are merged, keeping the minimum weight. The
+        edge arrays are then rebuilt once at their final size.
+        :param edges: iterable of (u, v, w)
+        :return: number of edges in the graph afterwards
+        """
+        lightest = {}  # (min(u, v), max(u, v)) -> weight, in first-seen order
+        for u, v, w in itertools.chain(zip(self.edge_u, self.edge_v, self.edge_w), edges):
+            if not (0 <= u < self.V and 0 <= v < self.V):
+                raise IndexError(f"edge ({u}, {v}) has a vertex outside 0..{self.V - 1}")
+            key = (u, v) if u <= v else (v, u)
+            old = lightest.get(key)
+            if old is None or w < old:
+                lightest[key] = w
+
+        m = len(lightest)
+        # numbers.Integral also covers NumPy integer scalars
+        typecode = "q" if all(isinstance(w, numbers.Integral) for w in lightest.values()) else "d"
+        edge_u = array("q", [0]) * m
+        edge_v = array("q", [0]) * m
+        edge_w = array(typecode, [0]) * m
+        for i, ((u, v), w) in enumerate(lightest.items()):
+            edge_u[i] = u
+            edge_v[i] = v
+            edge_w[i] = w
+        self.edge_u, self.edge_v, self.edge_w = edge_u, edge_v, edge_w
+        self._mmap = None
+        self._invalidate()
+        return m
+
+    def add_edges_from_arrays(self, us, vs, ws):
+        """
+        Bulk-load edges given as parallel arrays/lists of u, v and w (see add_edges).
+        array.array and NumPy array inputs are converted with tolist(), so the
+        weight type follows their typecode/dtype (integer weights stay integers).
+        """
+        if not (len(us) == len(vs) == len(ws)):
+            raise ValueError("us, vs and ws must have the same length")
+        typed = (array,) if np is None else (array, np.ndarray)
+        us, vs, ws = (xs.tolist() if isinstance(xs, typed) else xs for xs in (us, vs, ws))
+        return self.add_edges(zip(us, vs, ws))
+
+    def add_edges_from_csv(self, path):
+        """
+        Bulk-load edges from a CSV file with rows "u,v,w" (see add_edges).
+        u and v may be vertex ids or node names. The first line is skipped as a
+        header only when none of its fields parse as a vertex or a weight.
+        :param path: CSV file path
+        :return: number of edges in the graph afterwards
+        :raises ValueError: for a short or malformed row, naming its line number
+        """
+        def parse_vertex(field):
+            field = field.strip()
+            if field.isdigit():
+                vertex = int(field)
+                if vertex >= self.V:
+                    raise ValueError(f"vertex {vertex} outside 0..{self.V - 1}")
+                return vertex
+            if field in self.name_to_id:
+                return self.name_to_id[field]
+            raise ValueError(f"unknown vertex {field!r}")
+
+        def parse_weight(field):
+            try:
+                return int(field)
+            except ValueError:
+                return float(field)
+
+        def is_vertex(field):
+            try:
+                parse_vertex(field)
+            except ValueError:
+                return False
+            return True
+
+        def rows(reader):
+            for row in reader:
+                if not row:
+                    continue
+                line_no = reader.line_num
+                if len(row) < 3:
+                    raise ValueError(f"line {line_no}: expected 3 fields u,v,w, got {len(row)}")
+                # Only the first line may be a header, and only if no field parses
+                if line_no == 1 and not any(is_vertex(field) for field in row[:2]):
+                    try:
+                        parse_weight(row[2])
+                    except ValueError:
+                        continue
+                try:
+                    yield parse_vertex(row[0]), parse_vertex(row[1]), parse_weight(row[2])
+                except ValueError as e:
+                    raise ValueError(f"line {line_no}: {e}") from None
+
+        with open(path, newline="") as f:
+            return self.add_edges(rows(csv.reader(f)))
+
+    def _invalidate(self):
+        """Drop the cached views after the edges changed"""
+        self._csr = None
+        self._dense = None
+        self._adj_list = None
+
+    def csr(self):
+        """
+        Compressed Sparse Row (CSR) form of the graph, cached until the next change.
+        The neighbors of vertex u are neighbors[offsets[u]:offsets[u + 1]], with
+        the matching edge weights at the same positions in weights.
+        Space is O(V + E) instead of the O(V^2) of an adjacency matrix.
+        :return: (offsets, neighbors, weights) arrays
+        """
+        if self._csr is None:
+            m = len(self.edge_u)
+            # Count degrees, then prefix-sum them into row offsets
+            offsets = array("q", [0]) * (self.V + 1)
+            for u in self.edge_u:
+                offsets[u + 1] += 1
+            for v in self.edge_v:
+                offsets[v + 1] += 1
+            for i in range(self.V):
+                offsets[i + 1] += offsets[i]
+
+            # Every undirected edge is stored in both endpoint rows
+            neighbors = array("q", [0]) * (2 * m)
+            weights = array(self.edge_w.typecode, [0]) * (2 * m)
+            next_slot = offsets[:-1]
+            for u, v, w in zip(self.edge_u, self.edge_v, self.edge_w):
+                i = next_slot[u]
+                neighbors[i] = v
+                weights[i] = w
+                next_slot[u] = i + 1
+                j = next_slot[v]
+                neighbors[j] = u
+                weights[j] = w
+                next_slot[v] = j + 1
+            self._csr = (offsets, neighbors, weights)
+        return self._csr
+
+    def save_binary(self, path):
+        """
+        Write the graph to a compact binary file that open_binary can memory-map.
+        The file is written under a temporary name and then renamed over path,
+        so a crash mid-write never leaves a truncated graph file behind.
+        :param path: output file path
+        """
+        offsets, neighbors, weights = self.csr()
+        names = "\0".join(self.node_names).encode("utf-8")
+        byte_order = b"<" if sys.byteorder == "little" else b">"
+        weight_type = typecode_of(self.edge_w).encode("ascii")
+        tmp_path = f"{os.fspath(path)}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_GRAPH_HEADER.pack(GRAPH_MAGIC, GRAPH_VERSION, byte_order, weight_type,
+                                           self.V, len(self.edge_u), len(names)))
+                for section in (self.edge_u, self.edge_v, self.edge_w, offsets, neighbors, weights):
+                    f.write(section)
+                f.write(names)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def open_binary(cls, path):
+        """
+        Open a graph saved with save_binary by memory-mapping the file.
+        The edge and CSR arrays are read-only views straight into the mapping,
+        so opening does no per-edge work and processes that open the same file
+        share its pages through the OS page cache. The first add_edge copies
+        the edge arrays into memory.
+        :param path: file written by save_binary
+        :return: Graph
+        :raises ValueError: if the file is not a graph file or its size does not
+            match the counts in its header (e.g. a truncated file)
+        """
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(mapping)
+        try:
+            try:
+                magic, version, byte_order, weight_type, vertices, m, names_len = \
+                    _GRAPH_HEADER.unpack_from(buf)
+            except struct.error:
+                raise ValueError(f"{path} is too short to hold a graph file header") from None
+            if magic != GRAPH_MAGIC or version != GRAPH_VERSION:
+                raise ValueError(f"{path} is not a version {GRAPH_VERSION} graph file")
+            if byte_order != (b"<" if sys.byteorder == "little" else b">"):
+                raise ValueError(f"{path} was written on a machine with a different byte order")
+            weight_type = weight_type.decode("ascii", errors="replace")
+            if weight_type not in ("q", "d") or min(vertices, m, names_len) < 0:
+                raise ValueError(f"{path} has a corrupt header")
+            # edge_u, edge_v, edge_w: m each; offsets: V + 1; neighbors, weights: 2m each
+            expected = _GRAPH_HEADER.size + 8 * (3 * m + (vertices + 1) + 4 * m) + names_len
+            if len(mapping) != expected:
+                raise ValueError(f"{path} is {len(mapping)} bytes but its header "
+                                 f"describes {expected} (truncated or corrupt file)")
+            names = bytes(buf[expected - names_len:]).decode("utf-8")
+            names = names.split("\0") if names_len else []
+            if len(names) not in (0, vertices):
+                raise ValueError(f"{path} has {len(names)} node names for {vertices} vertices")
+            g = cls(vertices)
+            g.add_node_names(names)  # ValueError for duplicate names
+        except BaseException:
+            buf.release()
+            mapping.close()
+            raise
+
+        pos = _GRAPH_HEADER.size
+
+        def section(count, typecode):
+            nonlocal pos
+            view = buf[pos:pos + 8 * count].cast(typecode)
+            pos += 8 * count
+            return view
+
+        g.edge_u = section(m, "q")
+        g.edge_v = section(m, "q")
+        g.edge_w = section(m, weight_type)
+        g._csr = (section(vertices + 1, "q"), section(2 * m, "q"), section(2 * m, weight_type))
+        g._mmap = mapping
+        return g
+
+    @property
+    def adj_matrix(self):
+        """Dense V x V adjacency matrix view, materialized only when requested"""
+        if self._dense is None:
+            matrix = [[0 for _ in range(self.V)] for _ in range(self.V)]
+            for u, v, w in zip(self.edge_u, self.edge_v, self.edge_w):
+                matrix[u][v] = w
+                matrix[v][u] = w
+            self._dense = matrix
+        return self._dense
 
     def print_adj_matrix(self):
         """Display adjacency matrix"""
@@ -22,20 +458,39 @@ class Graph:
         for i, row in enumerate(self.adj_matrix):
             print(f"{self.node_names[i][:3]}:  " + "  ".join(f"{val:2}" for val in row))
 
+    def print_mst(self, title, edges, total_weight):
+        """Display MST edges by node name with the total weight"""
+        print(f"\n{title}")
+        for u, v, weight in edges:
+            print(f"  {self.node_names[u]} -- {self.node_names[v]}  ({weight} m)")
+        print(f"➡️ Total Minimum Distance: {total_weight} m")
+
     def adjacency_list(self):
-        """Convert adjacency matrix to adjacency list"""
-        adj_list = {self.node_names[i]: [] for i in range(self.V)}
-        for i in range(self.V):
-            for j in range(self.V):
-                if self.adj_matrix[i][j] != 0:
-                    adj_list[self.node_names[i]].append((self.node_names[j], self.adj_matrix[i][j]))
-        return adj_list
+        """Name-keyed adjacency list, built from the CSR arrays and cached until the next change"""
+        if self._adj_list is None:
+            offsets, neighbors, weights = self.csr()
+            adj_list = {}
+            for i in range(self.V):
+                adj_list[self.node_names[i]] = [(self.node_names[neighbors[k]], weights[k])
+                                                for k in range(offsets[i], offsets[i + 1])]
+            self._adj_list = adj_list
+        return self._adj_list
+
+    def connected_components(self):
+        """
+        Label every vertex with the id (0, 1, 2, ...) of its connected component.
+        :return: (number of components, array of labels indexed by vertex)
+        """
+        ds = DisjointSet(self.V)
+        ds.union_many(self.edge_u, self.edge_v)
+        return ds.labels()
 
     # ---------- Kruskal’s Algorithm ----------
     def find(self, parent, i):
-        if parent[i] != i:
-            parent[i] = self.find(parent, parent[i])
-        return parent[i]
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving, no recursion
+            i = parent[i]
+        return i
 
     def union(self, parent, rank, x, y):
         xroot = self.find(parent, x)
@@ -48,90 +503,650 @@ class Graph:
             parent[yroot] = xroot
             rank[xroot] += 1
 
-    def kruskal_mst(self):
+    def _kruskal(self, max_unions):
+        """
+        Kruskal's algorithm over the parallel edge arrays, stopped after max_unions tree edges.
+        Edge positions are argsorted by the weight column, so the edge arrays
+        (and the caller's edges) are never reordered, and the union-find loop
+        only handles integer vertex ids.
+        :return: (list of tree edges (u, v, w), DisjointSet of the resulting forest)
+        """
+        edge_u, edge_v, edge_w = self.edge_u, self.edge_v, self.edge_w
+        ds = DisjointSet(self.V)
         result = []  # Store MST edges
-        i, e = 0, 0  # i: edge counter, e: result counter
-        self.graph = sorted(self.graph, key=lambda item: item[2])  # sort edges by weight
-
-        parent = []
-        rank = []
-        for node in range(self.V):
-            parent.append(node)
-            rank.append(0)
-
-        while e < self.V - 1 and i < len(self.graph):
-            u, v, w = self.graph[i]
-            i += 1
-            x = self.find(parent, u)
-            y = self.find(parent, v)
-            if x != y:
-                e += 1
-                result.append((u, v, w))
-                self.union(parent, rank, x, y)
+        if max_unions > 0:
+            for i in argsort_weights(edge_w):
+                u, v = edge_u[i], edge_v[i]
+                if ds.union(u, v):  # False when u and v are already connected
+                    result.append((u, v, edge_w[i]))
+                    if len(result) == max_unions:
+                        break
+        return result, ds
 
+    def kruskal_mst(self):
+        """
+        Kruskal's algorithm; stops after V - 1 tree edges.
+        :return: (list of MST edges (u, v, w), total weight)
+        """
+        result, _ = self._kruskal(self.V - 1)
         total_weight = sum(w for _, _, w in result)
-        print("\n📘 Kruskal’s Minimum Spanning Tree:")
-        for u, v, weight in result:
-            print(f"  {self.node_names[u]} -- {self.node_names[v]}  ({weight} m)")
-        print(f"➡️ Total Minimum Distance: {total_weight} m")
+        return result, total_weight
+
+    def mst_clusters(self, k):
+        """
+        MST-based (single-linkage) clustering of the vertices into k clusters.
+        Kruskal's algorithm is stopped after V - k unions, which leaves the same
+        clusters as building the full MST and cutting its k - 1 heaviest edges,
+        without sorting through the remaining edges.
+        :param k: number of clusters (a graph with more than k connected
+                  components gives one cluster per component)
+        :return: (number of clusters, array of cluster labels indexed by vertex,
+                  list of tree edges (u, v, w) inside the clusters)
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        forest, ds = self._kruskal(self.V - k)
+        count, labels = ds.labels()
+        return count, labels, forest
+
+    def boruvka_mst(self, workers=None, chunk_size=None, threshold=BORUVKA_PARALLEL_THRESHOLD):
+        """
+        Borůvka's algorithm with the cheapest-edge search spread over processes.
+        Each round every component picks its cheapest outgoing edge (the edge
+        list is split into chunks searched in parallel), those edges are added,
+        and the components are contracted with union-find. At most log2(V)
+        rounds are needed. Disconnected graphs give a minimum spanning forest.
+        :param workers: number of worker processes (default: all CPU cores;
+                        1 runs everything in this process)
+        :param chunk_size: edges per task (default: an equal share per worker)
+        :param threshold: minimum number of edges before the process pool is used;
+                          smaller graphs run in this process
+        :return: (list of MST edges (u, v, w), total weight)
+        """
+        edge_u, edge_v, edge_w = self.edge_u, self.edge_v, self.edge_w
+        m = len(edge_u)
+        workers = (workers or os.cpu_count() or 1) if m >= threshold else 1
+        chunk_size = chunk_size or max(1, -(-m // workers))
+        bounds = [(lo, min(lo + chunk_size, m)) for lo in range(0, m, chunk_size)]
+
+        pool = None
+        if workers > 1 and len(bounds) > 1:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_boruvka_worker,
+                                       initargs=tuple(map(as_array, (edge_u, edge_v, edge_w))))
+        ds = DisjointSet(self.V)
+        result = []
+        total_weight = 0
+        try:
+            while True:
+                component = ds.find_many()
+                if pool is not None:
+                    partials = pool.map(_cheapest_edges_worker, itertools.repeat(component),
+                                        [lo for lo, _ in bounds], [hi for _, hi in bounds])
+                else:
+                    partials = [cheapest_edges(edge_u, edge_v, edge_w, component, lo, hi)
+                                for lo, hi in bounds]
+
+                # Combine the per-chunk winners into one cheapest edge per component
+                best = {}
+                for partial in partials:
+                    for c, i in partial.items():
+                        j = best.get(c)
+                        if j is None or edge_w[i] < edge_w[j] or (edge_w[i] == edge_w[j] and i < j):
+                            best[c] = i
+                if not best:
+                    break  # no edge leaves any component: the forest is complete
+
+                for i in sorted(set(best.values())):
+                    if ds.union(edge_u[i], edge_v[i]):
+                        result.append((edge_u[i], edge_v[i], edge_w[i]))
+                        total_weight += edge_w[i]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return result, total_weight
+
+    # ---------- Shortest Paths ----------
+    def dijkstra(self, source):
+        """
+        Dijkstra's algorithm with a binary heap from source to every vertex: O(E log V).
+        :return: (list of distances, list of parent vertices); inf / None if unreachable
+        """
+        search = ShortestPathSearch(self, source)
+        search.settle_all()
+        dist = [float("inf")] * self.V
+        parent = [None] * self.V
+        for v, d in search.dist.items():
+            dist[v] = d
+            parent[v] = search.parent[v]
+        return dist, parent
+
+    def shortest_path(self, source, target):
+        """Dijkstra that stops as soon as target is settled: (distance, path)"""
+        return ShortestPathSearch(self, source).path_to(target)
+
+    def bidirectional_dijkstra(self, source, target):
+        """
+        Point-to-point Dijkstra run from both ends at once, always expanding the
+        side with the smaller frontier key. It stops once the two frontier keys
+        add up to at least the best meeting distance found so far, which usually
+        settles far fewer vertices than a one-sided search.
+        :return: (distance, path); (inf, []) if target is unreachable
+        """
+        if source == target:
+            return 0, [source]
+        offsets, neighbors, weights = self.csr()
+        dist = ({source: 0}, {target: 0})
+        parent = ({source: None}, {target: None})
+        settled = (set(), set())
+        heaps = ([(0, source)], [(0, target)])
+        best, meet = float("inf"), None
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            other = 1 - side
+            d, u = heapq.heappop(heaps[side])
+            if u in settled[side]:
+                continue
+            settled[side].add(u)
+            for k in range(offsets[u], offsets[u + 1]):
+                v = neighbors[k]
+                nd = d + weights[k]
+                if nd < dist[side].get(v, float("inf")):
+                    dist[side][v] = nd
+                    parent[side][v] = u
+                    heapq.heappush(heaps[side], (nd, v))
+                if v in dist[other] and dist[side][v] + dist[other][v] < best:
+                    best = dist[side][v] + dist[other][v]
+                    meet = v
+        if meet is None:
+            return float("inf"), []
+        path = _trace_path(parent[0], meet)
+        path.extend(reversed(_trace_path(parent[1], meet)[:-1]))
+        return best, path
+
+    def astar(self, source, target, heuristic=None):
+        """
+        A* search: Dijkstra ordered by distance-so-far plus heuristic(v, target).
+        The heuristic must never overestimate and must be consistent (e.g. the
+        straight-line distance between buildings); None behaves like Dijkstra.
+        :return: (distance, path); (inf, []) if target is unreachable
+        """
+        offsets, neighbors, weights = self.csr()
+        h = heuristic or (lambda v, t: 0)
+        dist = {source: 0}
+        parent = {source: None}
+        closed = set()
+        heap = [(h(source, target), 0, source)]
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            if u in closed:
+                continue
+            if u == target:
+                return d, _trace_path(parent, u)
+            closed.add(u)
+            for k in range(offsets[u], offsets[u + 1]):
+                v = neighbors[k]
+                nd = d + weights[k]
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd + h(v, target), nd, v))
+        return float("inf"), []
+
+    def distance_matrix(self, sources, targets):
+        """
+        Many-to-many shortest distances. One resumable search is run per source
+        and reused for all of its targets, so each search only grows as far as
+        the farthest target needs.
+        :return: list of rows, matrix[i][j] = distance from sources[i] to targets[j]
+        """
+        matrix = []
+        for source in sources:
+            search = ShortestPathSearch(self, source)
+            matrix.append([search.distance_to(target) for target in targets])
+        return matrix
+
+    def build_distance_index(self):
+        """Precompute a HubLabelIndex for fast repeated distance queries"""
+        return HubLabelIndex.build(self)
+
+    def dynamic_mst(self):
+        """MST of the current edges that can then be updated edge by edge (see DynamicMST)"""
+        return DynamicMST(self.V, zip(self.edge_u, self.edge_v, self.edge_w))
 
     # ---------- Prim’s Algorithm ----------
-    def prim_mst(self):
-        selected = [False] * self.V
-        no_edge = 0
-        selected[0] = True
-        print("\n📗 Prim’s Minimum Spanning Tree:")
+    def prim_mst(self, start=0):
+        """
+        Prim's algorithm with a binary min-heap over the CSR adjacency: O(E log V).
+        Stale heap entries (vertex already in the tree) are skipped when popped.
+        If the graph is disconnected a new tree is grown from the next unreached
+        vertex, so the result is a minimum spanning forest.
+        :param start: vertex the first tree is grown from
+        :return: (list of MST edges (u, v, w), total weight)
+        """
+        offsets, neighbors, weights = self.csr()
+        in_tree = [False] * self.V
+        result = []
         total_weight = 0
+        if self.V == 0:
+            return result, total_weight
+
+        for root in itertools.chain([start], range(self.V)):
+            if in_tree[root]:
+                continue
+            in_tree[root] = True
+            heap = [(weights[k], root, neighbors[k]) for k in range(offsets[root], offsets[root + 1])]
+            heapq.heapify(heap)
+            while heap:
+                w, u, v = heapq.heappop(heap)
+                if in_tree[v]:
+                    continue
+                in_tree[v] = True
+                result.append((u, v, w))
+                total_weight += w
+                for k in range(offsets[v], offsets[v + 1]):
+                    x = neighbors[k]
+                    if not in_tree[x]:
+                        heapq.heappush(heap, (weights[k], v, x))
+        return result, total_weight
+
+
+def _trace_path(parent, vertex):
+    """Follow parent links back from vertex; returns the path ending at vertex"""
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parent[vertex]
+    path.reverse()
+    return path
+
+
+class ShortestPathSearch:
+    """
+    Resumable single-source Dijkstra search over a Graph's CSR arrays.
+    distance_to() settles vertices only until the requested target is settled.
+    The heap and distances are kept between calls, so further targets from the
+    same source continue from the current frontier instead of starting over.
+    Edge weights must be non-negative.
+    """
+    def __init__(self, graph, source):
+        self.offsets, self.neighbors, self.weights = graph.csr()
+        self.source = source
+        self.dist = {source: 0}        # best known distance (final once settled)
+        self.parent = {source: None}   # shortest-path tree
+        self.settled = set()
+        self.heap = [(0, source)]
+
+    def _settle_next(self):
+        """Settle the closest unsettled vertex; returns False when none is reachable"""
+        offsets, neighbors, weights = self.offsets, self.neighbors, self.weights
+        dist, heap = self.dist, self.heap
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u in self.settled:
+                continue  # stale entry
+            self.settled.add(u)
+            for k in range(offsets[u], offsets[u + 1]):
+                v = neighbors[k]
+                nd = d + weights[k]
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    self.parent[v] = u
+                    heapq.heappush(heap, (nd, v))
+            return True
+        return False
+
+    def distance_to(self, target):
+        """Shortest distance from the source to target (inf if unreachable)"""
+        while target not in self.settled:
+            if not self._settle_next():
+                return float("inf")
+        return self.dist[target]
+
+    def path_to(self, target):
+        """(distance, list of vertices) from the source to target; ([] if unreachable)"""
+        d = self.distance_to(target)
+        return d, (_trace_path(self.parent, target) if d != float("inf") else [])
+
+    def settle_all(self):
+        """Run the search to completion (every reachable vertex settled)"""
+        while self._settle_next():
+            pass
 
-        while no_edge < self.V - 1:
-            minimum = float('inf')
-            x = 0
-            y = 0
-            for i in range(self.V):
-                if selected[i]:
-                    for j in range(self.V):
-                        if (not selected[j]) and self.adj_matrix[i][j]:
-                            if minimum > self.adj_matrix[i][j]:
-                                minimum = self.adj_matrix[i][j]
-                                x = i
-                                y = j
-            print(f"  {self.node_names[x]} -- {self.node_names[y]}  ({self.adj_matrix[x][y]} m)")
-            total_weight += self.adj_matrix[x][y]
-            selected[y] = True
-            no_edge += 1
-        print(f"➡️ Total Minimum Distance: {total_weight} m")
+
+class HubLabelIndex:
+    """
+    Precomputed distance oracle (hub labels) for point-to-point queries.
+    Every vertex v keeps a label {hub: distance(v, hub)} such that any two
+    vertices share a hub on one of their shortest paths, so
+        distance(s, t) = min over common hubs h of label[s][h] + label[t][h]
+    and a query is a few dictionary lookups with no graph search at all.
+    Labels are built with Pruned Landmark Labeling: a Dijkstra is run from
+    every vertex (highest degree first) and pruned wherever the labels found
+    so far already give the right distance, which keeps labels small.
+    """
+    def __init__(self, labels, typecode="q"):
+        self.labels = labels      # list of dicts, one per vertex
+        self.typecode = typecode  # "q" for integer distances, "d" for floats
+
+    @staticmethod
+    def _label_distance(label_a, label_b):
+        if len(label_b) < len(label_a):
+            label_a, label_b = label_b, label_a
+        best = float("inf")
+        for hub, d in label_a.items():
+            other = label_b.get(hub)
+            if other is not None and d + other < best:
+                best = d + other
+        return best
+
+    @classmethod
+    def build(cls, graph):
+        """
+        Offline preprocessing step: compute hub labels for every vertex of graph.
+        :param graph: Graph with non-negative edge weights
+        :return: HubLabelIndex
+        """
+        offsets, neighbors, weights = graph.csr()
+        order = sorted(range(graph.V), key=lambda v: offsets[v + 1] - offsets[v], reverse=True)
+        labels = [{} for _ in range(graph.V)]
+        for hub in order:
+            hub_label = labels[hub]
+            dist = {hub: 0}
+            settled = set()
+            heap = [(0, hub)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if u in settled:
+                    continue
+                settled.add(u)
+                # Prune: an earlier hub already covers this distance
+                if cls._label_distance(hub_label, labels[u]) <= d:
+                    continue
+                labels[u][hub] = d
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = neighbors[k]
+                    nd = d + weights[k]
+                    if nd < dist.get(v, float("inf")):
+                        dist[v] = nd
+                        heapq.heappush(heap, (nd, v))
+        return cls(labels, "q" if typecode_of(graph.edge_w) == "q" else "d")
+
+    def distance(self, source, target):
+        """Shortest distance between two vertices (inf if not connected)"""
+        if source == target:
+            return 0
+        return self._label_distance(self.labels[source], self.labels[target])
+
+    def save(self, path):
+        """Serialize the index to a binary file (flattened label arrays)"""
+        offsets = array("q", [0])
+        hubs = array("q")
+        dists = array(self.typecode)
+        for label in self.labels:
+            hubs.extend(label.keys())
+            dists.extend(label.values())
+            offsets.append(len(hubs))
+        byte_order = b"<" if sys.byteorder == "little" else b">"
+        with open(path, "wb") as f:
+            f.write(_LABELS_HEADER.pack(LABELS_MAGIC, LABELS_VERSION, byte_order,
+                                        self.typecode.encode("ascii"), len(self.labels), len(hubs)))
+            f.write(offsets)
+            f.write(hubs)
+            f.write(dists)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save, e.g. at service startup"""
+        with open(path, "rb") as f:
+            magic, version, byte_order, typecode, vertices, entries = \
+                _LABELS_HEADER.unpack(f.read(_LABELS_HEADER.size))
+            if magic != LABELS_MAGIC or version != LABELS_VERSION:
+                raise ValueError(f"{path} is not a version {LABELS_VERSION} hub label file")
+            if byte_order != (b"<" if sys.byteorder == "little" else b">"):
+                raise ValueError(f"{path} was written on a machine with a different byte order")
+            typecode = typecode.decode("ascii")
+            offsets = array("q")
+            offsets.fromfile(f, vertices + 1)
+            hubs = array("q")
+            hubs.fromfile(f, entries)
+            dists = array(typecode)
+            dists.fromfile(f, entries)
+        labels = [dict(zip(hubs[offsets[v]:offsets[v + 1]], dists[offsets[v]:offsets[v + 1]]))
+                  for v in range(vertices)]
+        return cls(labels, typecode)
+
+
+class DynamicMST:
+    """
+    Minimum spanning forest that is kept up to date while edges change.
+    Tree edges live in an adjacency map of the forest, all other edges in a
+    non-tree map, and updates apply the cycle and cut properties:
+    - Insert / lower a weight: an edge joining two trees is added directly;
+      otherwise it replaces the heaviest edge on the tree path between its
+      endpoints if it is lighter (cycle property).
+    - Delete / raise the weight of a tree edge: the tree is split and the
+      lightest non-tree edge reconnecting the two halves is added (cut property).
+    An update costs O(V) for the tree path search (O(V + E) to find a
+    replacement after a tree edge is removed) instead of a full recomputation.
+    tree_edges and total_weight are always current, so queries are O(1).
+    """
+    def __init__(self, vertices, edges=()):
+        """
+        Seed the maintained MST with Kruskal's algorithm.
+        :param vertices: number of vertices
+        :param edges: iterable of (u, v, w); for parallel edges the lightest is kept
+                      (self-loops are kept as non-tree edges)
+        """
+        self.V = vertices
+        self.tree = [{} for _ in range(vertices)]  # forest adjacency: u -> {v: w}
+        self.tree_edges = {}  # (min(u, v), max(u, v)) -> w for every MST edge
+        self.non_tree = {}    # same key -> w for every other edge
+        self.total_weight = 0
+
+        lightest = {}
+        for u, v, w in edges:
+            key = (min(u, v), max(u, v))
+            if key not in lightest or w < lightest[key]:
+                lightest[key] = w
+        ds = DisjointSet(vertices)
+        for key, w in sorted(lightest.items(), key=lambda item: item[1]):
+            if ds.union(*key):
+                self._link(key, w)
+            else:
+                self.non_tree[key] = w
+
+    def _link(self, key, w):
+        u, v = key
+        self.tree[u][v] = w
+        self.tree[v][u] = w
+        self.tree_edges[key] = w
+        self.total_weight += w
+
+    def _cut(self, key):
+        u, v = key
+        del self.tree[u][v]
+        del self.tree[v][u]
+        self.total_weight -= self.tree_edges.pop(key)
+
+    def _tree_path(self, u, v):
+        """Edges (key, w) on the forest path from u to v, or None if not connected"""
+        parent = {u: None}
+        stack = [u]
+        while stack and v not in parent:
+            x = stack.pop()
+            for y in self.tree[x]:
+                if y not in parent:
+                    parent[y] = x
+                    stack.append(y)
+        if v not in parent:
+            return None
+        path = []
+        while parent[v] is not None:
+            p = parent[v]
+            path.append(((min(p, v), max(p, v)), self.tree[p][v]))
+            v = p
+        return path
+
+    def _reconnect(self, u):
+        """After a cut, add the lightest non-tree edge leaving u's tree (if any)"""
+        side = {u}
+        stack = [u]
+        while stack:
+            for y in self.tree[stack.pop()]:
+                if y not in side:
+                    side.add(y)
+                    stack.append(y)
+        best = None
+        for key, w in self.non_tree.items():
+            if (key[0] in side) != (key[1] in side) and (best is None or w < best[1]):
+                best = (key, w)
+        if best is not None:
+            del self.non_tree[best[0]]
+            self._link(*best)
+
+    def insert_edge(self, u, v, w):
+        """Add a new edge (u, v) with weight w and repair the MST"""
+        key = (min(u, v), max(u, v))
+        if key in self.tree_edges or key in self.non_tree:
+            raise ValueError(f"edge {key} already exists; use update_weight")
+        if u == v:
+            # A self-loop can never be part of a spanning tree, but it is still
+            # recorded so delete_edge / update_weight see it like any other edge
+            self.non_tree[key] = w
+            return
+        path = self._tree_path(u, v)
+        if path is None:
+            self._link(key, w)
+            return
+        heaviest_key, heaviest_w = max(path, key=lambda item: item[1])
+        if w < heaviest_w:
+            self._cut(heaviest_key)
+            self.non_tree[heaviest_key] = heaviest_w
+            self._link(key, w)
+        else:
+            self.non_tree[key] = w
+
+    def delete_edge(self, u, v):
+        """Remove edge (u, v) and repair the MST"""
+        key = (min(u, v), max(u, v))
+        if key in self.non_tree:
+            del self.non_tree[key]
+        elif key in self.tree_edges:
+            self._cut(key)
+            self._reconnect(key[0])
+        else:
+            raise KeyError(f"edge {key} does not exist")
+
+    def update_weight(self, u, v, w):
+        """Change the weight of edge (u, v) and repair the MST"""
+        key = (min(u, v), max(u, v))
+        if key in self.non_tree:
+            del self.non_tree[key]
+            self.insert_edge(u, v, w)
+        elif key in self.tree_edges:
+            old = self.tree_edges[key]
+            if w <= old:
+                # A lighter tree edge keeps the tree minimal
+                self.tree[u][v] = self.tree[v][u] = self.tree_edges[key] = w
+                self.total_weight += w - old
+            else:
+                # A heavier tree edge may lose to another edge across the cut
+                self._cut(key)
+                self.non_tree[key] = w
+                self._reconnect(key[0])
+        else:
+            raise KeyError(f"edge {key} does not exist")
+
+
+def benchmark_mst(vertices=(10_000, 100_000), edges_per_vertex=8, workers=None):
+    """
+    Time kruskal_mst, prim_mst and boruvka_mst on random connected graphs.
+    :param vertices: graph sizes to test
+    :param edges_per_vertex: average number of edges per vertex
+    :param workers: worker processes for boruvka_mst (default: all CPU cores)
+    """
+    rng = random.Random(7)
+    print(f"{'V':>9} {'E':>10} {'kruskal':>9} {'prim':>9} {'boruvka':>9}")
+    for n in vertices:
+        g = Graph(n)
+        for v in range(1, n):  # random spanning tree keeps the graph connected
+            g.add_edge(rng.randrange(v), v, rng.randint(1, 1000))
+        for _ in range(n * (edges_per_vertex - 1)):
+            g.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(1, 1000))
+
+        timings = []
+        totals = set()
+        for run in (g.kruskal_mst, g.prim_mst, lambda: g.boruvka_mst(workers=workers, threshold=0)):
+            start = time.perf_counter()
+            _, total_weight = run()
+            timings.append(time.perf_counter() - start)
+            totals.add(total_weight)
+        if len(totals) != 1:
+            raise AssertionError(f"MST algorithms disagree: {totals}")
+        print(f"{n:>9} {len(g.edge_u):>10} " + " ".join(f"{t:>8.2f}s" for t in timings))
 
 
 # -------------------------------------------
 # Example: College Campus Graph
 # -------------------------------------------
 
-# Define departments/buildings
-names = ["Admin", "CS Dept", "AIML Dept", "Library", "Canteen", "Workshop"]
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark_mst()
+        sys.exit()
+
+    # Define departments/buildings
+    names = ["Admin", "CS Dept", "AIML Dept", "Library", "Canteen", "Workshop"]
+
+    # Create graph
+    g = Graph(len(names))
+    g.add_node_names(names)
+
+    # Add weighted edges (distances in meters)
+    g.add_edge(0, 1, 10)  # Admin - CS
+    g.add_edge(0, 2, 15)  # Admin - AIML
+    g.add_edge(1, 3, 12)  # CS - Library
+    g.add_edge(2, 3, 13)  # AIML - Library
+    g.add_edge(1, 4, 15)  # CS - Canteen
+    g.add_edge(3, 5, 5)   # Library - Workshop
+    g.add_edge(4, 5, 10)  # Canteen - Workshop
+
+    # Display representations
+    g.print_adj_matrix()
+
+    print("\nAdjacency List:")
+    for k, v in g.adjacency_list().items():
+        print(f" {k} -> {v}")
 
-# Create graph
-g = Graph(len(names))
-g.add_node_names(names)
+    # Run MST Algorithms
+    kruskal_edges, kruskal_total = g.kruskal_mst()
+    g.print_mst("📘 Kruskal’s Minimum Spanning Tree:", kruskal_edges, kruskal_total)
+    prim_edges, prim_total = g.prim_mst()
+    g.print_mst("📗 Prim’s Minimum Spanning Tree:", prim_edges, prim_total)
+    boruvka_edges, boruvka_total = g.boruvka_mst(workers=2)
+    g.print_mst("📒 Borůvka’s Minimum Spanning Tree:", boruvka_edges, boruvka_total)
 
-# Add weighted edges (distances in meters)
-g.add_edge(0, 1, 10)  # Admin - CS
-g.add_edge(0, 2, 15)  # Admin - AIML
-g.add_edge(1, 3, 12)  # CS - Library
-g.add_edge(2, 3, 13)  # AIML - Library
-g.add_edge(1, 4, 15)  # CS - Canteen
-g.add_edge(3, 5, 5)   # Library - Workshop
-g.add_edge(4, 5, 10)  # Canteen - Workshop
+    # Route queries between buildings
+    print("\n🏛️ Next to the Library:", [(names[v], w) for v, w in g.neighbors("Library")])
+    distance, path = g.bidirectional_dijkstra(g.vertex_id("Admin"), g.vertex_id("Workshop"))
+    print(f"🧭 Shortest route Admin -> Workshop: {' -> '.join(names[v] for v in path)} ({distance} m)")
 
-# Display representations
-g.print_adj_matrix()
+    index = g.build_distance_index()
+    print(f"🗂️ Indexed distance CS Dept -> Canteen: {index.distance(1, 4)} m")
 
-print("\nAdjacency List:")
-for k, v in g.adjacency_list().items():
-    print(f" {k} -> {v}")
+    # Group the buildings into 2 zones by cutting the heaviest MST edge
+    zone_count, zones, _ = g.mst_clusters(2)
+    for zone in range(zone_count):
+        print(f"🏘️ Zone {zone + 1}:", [names[v] for v in range(len(names)) if zones[v] == zone])
 
-# Run MST Algorithms
-g.kruskal_mst()
-g.prim_mst()
+    # Keep the MST up to date while the campus changes
+    live = g.dynamic_mst()
+    live.insert_edge(0, 3, 8)      # new Admin - Library path
+    live.update_weight(1, 4, 6)    # CS - Canteen path shortened
+    g.print_mst("📙 MST after campus changes:", sorted(k + (w,) for k, w in live.tree_edges.items()),
+                live.total_weight)
 
 
 
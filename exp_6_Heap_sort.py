@@ -1,65 +1,747 @@
+import asyncio
+import queue
+import random
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+
+
 def heapify(arr, n, i):
     """
     Function to maintain the max-heap property.
+    Sifts arr[i] down iteratively: larger children are moved up into the
+    "hole" and the original value is written once at its final position.
     :param arr: list of integers
     :param n: size of the heap
     :param i: index of the current node
     """
-    largest = i         # Initialize largest as root
-    left = 2 * i + 1    # Left child index
-    right = 2 * i + 2   # Right child index
+    item = arr[i]
+    while True:
+        child = 2 * i + 1    # Left child index
+        if child >= n:
+            break
+        # Pick the right child if it exists and is greater than the left one
+        if child + 1 < n and arr[child + 1] > arr[child]:
+            child += 1
+        # Stop once neither child is greater than the value being sifted
+        if not arr[child] > item:
+            break
+        arr[i] = arr[child]  # Move the larger child up
+        i = child
+    arr[i] = item
+
+
+def min_heapify(arr, n, i):
+    """
+    Function to maintain the min-heap property (mirror image of heapify).
+    :param arr: list of comparable values
+    :param n: size of the heap
+    :param i: index of the current node
+    """
+    item = arr[i]
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and arr[child + 1] < arr[child]:
+            child += 1
+        if not arr[child] < item:
+            break
+        arr[i] = arr[child]
+        i = child
+    arr[i] = item
+
+
+def heapify_dary(arr, n, i, d=4):
+    """
+    Max-heap sift-down for a d-ary heap (children of i at d*i+1 ... d*i+d).
+    A wider node keeps the tree shallower and its children adjacent in memory.
+    :param arr: list of comparable values
+    :param n: size of the heap
+    :param i: index of the current node
+    :param d: number of children per node
+    """
+    item = arr[i]
+    while True:
+        first = d * i + 1
+        if first >= n:
+            break
+        child = first
+        for c in range(first + 1, min(first + d, n)):
+            if arr[c] > arr[child]:
+                child = c
+        if not arr[child] > item:
+            break
+        arr[i] = arr[child]
+        i = child
+    arr[i] = item
+
+
+def heapify_bottom_up(arr, n, i, d=2):
+    """
+    Floyd's "bottom-up" sift-down for a d-ary max-heap.
+    The hole is first walked down to a leaf along the largest children without
+    comparing against the sifted value, which is then sifted back up. Values
+    taken from the end of the heap usually belong near the leaves, so this
+    saves about one comparison per level.
+    :param arr: list of comparable values
+    :param n: size of the heap
+    :param i: index of the current node
+    :param d: number of children per node
+    """
+    item = arr[i]
+    start = i
+    while True:
+        first = d * i + 1
+        if first >= n:
+            break
+        child = first
+        for c in range(first + 1, min(first + d, n)):
+            if arr[c] > arr[child]:
+                child = c
+        arr[i] = arr[child]
+        i = child
+    while i > start:
+        parent = (i - 1) // d
+        if not item > arr[parent]:
+            break
+        arr[i] = arr[parent]
+        i = parent
+    arr[i] = item
+
+
+def heap_sort_dary(arr, d=4, bottom_up=False):
+    """
+    Heap Sort on a d-ary Max-Heap.
+    :param arr: list of comparable values
+    :param d: number of children per node (2 is the classic binary heap)
+    :param bottom_up: use Floyd's bottom-up sift-down
+    :return: sorted list (ascending order)
+    """
+    sift = heapify_bottom_up if bottom_up else heapify_dary
+    n = len(arr)
+    for i in range((n - 2) // d, -1, -1):
+        sift(arr, n, i, d)
+    for i in range(n - 1, 0, -1):
+        arr[i], arr[0] = arr[0], arr[i]
+        sift(arr, i, 0, d)
+    return arr
+
+
+def benchmark_heap_sorts(sizes=(10_000, 100_000, 1_000_000), repeat=3):
+    """
+    Compare heap layouts: the binary heap_sort against d-ary and bottom-up variants.
+    Prints the best time of `repeat` runs for each array size.
+    :param sizes: array sizes to test
+    :param repeat: runs per variant and size
+    """
+    variants = [
+        ("binary", heap_sort),
+        ("binary bottom-up", lambda a: heap_sort_dary(a, 2, bottom_up=True)),
+        ("4-ary", lambda a: heap_sort_dary(a, 4)),
+        ("4-ary bottom-up", lambda a: heap_sort_dary(a, 4, bottom_up=True)),
+        ("8-ary", lambda a: heap_sort_dary(a, 8)),
+    ]
+    rng = random.Random(42)
+    print(f"{'size':>10}  " + "  ".join(f"{name:>16}" for name, _ in variants))
+    for n in sizes:
+        data = [rng.random() for _ in range(n)]
+        expected = sorted(data)
+        timings = []
+        for _, sort in variants:
+            best = float("inf")
+            for _ in range(repeat):
+                arr = list(data)
+                start = time.perf_counter()
+                sort(arr)
+                best = min(best, time.perf_counter() - start)
+                if arr != expected:
+                    raise AssertionError("heap sort variant produced a wrong result")
+            timings.append(best)
+        print(f"{n:>10}  " + "  ".join(f"{t:>15.3f}s" for t in timings))
 
-    # Check if left child exists and is greater than root
-    if left < n and arr[left] > arr[largest]:
-        largest = left
 
-    # Check if right child exists and is greater than largest so far
-    if right < n and arr[right] > arr[largest]:
-        largest = right
+def min_heap_push(heap, entry):
+    """Add entry to a list kept as a Min-Heap (sift-up from the new leaf)."""
+    heap.append(entry)
+    i = len(heap) - 1
+    while i > 0:
+        parent = (i - 1) // 2
+        if not entry < heap[parent]:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = entry
 
-    # If largest is not root, swap and continue heapifying
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]  # Swap
-        # Recursively heapify the affected subtree
-        heapify(arr, n, largest)
 
+def min_heap_pop(heap):
+    """Remove and return the smallest entry of a list kept as a Min-Heap."""
+    last = heap.pop()  # IndexError when the heap is empty
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    min_heapify(heap, len(heap), 0)
+    return top
 
-def heap_sort(arr):
+
+def print_trace(event, arr, i=None):
+    """
+    Trace hook for heap_sort that prints every step of the algorithm.
+    :param event: "start", "built", "swap", "heapified" or "done"
+    :param arr: the array being sorted
+    :param i: boundary between heap and sorted part (swap/heapified events)
+    """
+    if event == "start":
+        print("🔹 Step 1: Building Max-Heap...")
+    elif event == "built":
+        print("   Max-Heap formed:", arr)
+        print("\n🔹 Step 2: Extract elements one by one from the heap...")
+    elif event == "swap":
+        print(f"   Swap max element {arr[i]} to position {i}: {arr}")
+    elif event == "heapified":
+        print(f"   Heap after removing element {arr[i]}: {arr[:i]} | Sorted part: {arr[i:]}")
+    elif event == "done":
+        print("\n✅ Sorted array (Ascending Order):", arr)
+
+
+def heap_sort(arr, trace=None):
     """
     Function to perform Heap Sort using Max-Heap.
+    Runs silently unless a trace hook (e.g. print_trace) is given.
     :param arr: list of integers
+    :param trace: optional callback trace(event, arr, i) called at every step
     :return: sorted list (ascending order)
     """
     n = len(arr)
 
-    print("🔹 Step 1: Building Max-Heap...")
+    if trace:
+        trace("start", arr)
     # Build a maxheap (rearrange array)
     for i in range(n // 2 - 1, -1, -1):
         heapify(arr, n, i)
-    print("   Max-Heap formed:", arr)
+    if trace:
+        trace("built", arr)
 
-    print("\n🔹 Step 2: Extract elements one by one from the heap...")
     # Extract elements from heap one by one
     for i in range(n - 1, 0, -1):
         # Move current root (largest) to end
         arr[i], arr[0] = arr[0], arr[i]
-        print(f"   Swap max element {arr[i]} to position {i}: {arr}")
+        if trace:
+            trace("swap", arr, i)
 
         # Call heapify on the reduced heap
         heapify(arr, i, 0)
-        print(f"   Heap after removing element {arr[i]}: {arr[:i]} | Sorted part: {arr[i:]}")
+        if trace:
+            trace("heapified", arr, i)
 
-    print("\n✅ Sorted array (Ascending Order):", arr)
+    if trace:
+        trace("done", arr)
     return arr
 
 
+def top_k(iterable, k, key=None, largest=False, sort_result=True):
+    """
+    Select the k smallest (or largest) elements of a stream in O(n log k) time.
+    Only a bounded heap of k entries is kept, with the "worst" kept element at
+    the root: a Max-Heap when looking for the smallest values and a Min-Heap when
+    looking for the largest. Each new element only has to beat that root.
+    :param iterable: any iterable, consumed once
+    :param k: number of elements to keep
+    :param key: optional function extracting the comparison key
+    :param largest: select the largest elements instead of the smallest
+    :param sort_result: return the k elements in sorted order (best first)
+    :return: list of at most k elements
+    """
+    if k <= 0:
+        return []
+    # Entries are (key, tie-breaker, element). The tie-breaker makes earlier
+    # elements win among equal keys and keeps elements from being compared.
+    sift = min_heapify if largest else heapify
+    sign = -1 if largest else 1
+    heap = []
+    for seq, element in enumerate(iterable):
+        entry = (element if key is None else key(element), sign * seq, element)
+        if len(heap) < k:
+            heap.append(entry)
+            if len(heap) == k:
+                for i in range(k // 2 - 1, -1, -1):
+                    sift(heap, k, i)
+        elif (entry > heap[0]) if largest else (entry < heap[0]):
+            heap[0] = entry  # replace the worst kept element
+            sift(heap, k, 0)
+
+    if sort_result:
+        heap_sort(heap)
+        if largest:
+            heap.reverse()
+    return [element for _, _, element in heap]
+
+
+def nsmallest(k, iterable, key=None, sort_result=True):
+    """The k smallest elements of iterable (see top_k)."""
+    return top_k(iterable, k, key=key, largest=False, sort_result=sort_result)
+
+
+def nlargest(k, iterable, key=None, sort_result=True):
+    """The k largest elements of iterable (see top_k)."""
+    return top_k(iterable, k, key=key, largest=True, sort_result=sort_result)
+
+
+class IndexedHeap:
+    """
+    Long-lived binary Min-Heap of (item, priority) pairs for job scheduling.
+    A position index maps every queued item to its slot in the heap, so the
+    priority of any item can be decreased or increased in O(log n) without
+    rebuilding. Items must be hashable and unique.
+    """
+    def __init__(self, pairs=()):
+        """
+        Build the heap from existing (item, priority) pairs in O(n).
+        :param pairs: iterable of (item, priority) pairs
+        """
+        self.items = []
+        self.priorities = []
+        self.position = {}  # item -> index in items / priorities
+        for item, priority in pairs:
+            if item in self.position:
+                raise ValueError(f"duplicate item {item!r}")
+            self.position[item] = len(self.items)
+            self.items.append(item)
+            self.priorities.append(priority)
+        # Same bottom-up build as heap_sort: sift down every internal node
+        for i in range(len(self.items) // 2 - 1, -1, -1):
+            self._sift_down(i)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def _move(self, item, priority, i):
+        """Place item with its priority at slot i and record the new position."""
+        self.items[i] = item
+        self.priorities[i] = priority
+        self.position[item] = i
+
+    def _sift_up(self, i):
+        """Move the entry at slot i up while it is smaller than its parent."""
+        item, priority = self.items[i], self.priorities[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if not priority < self.priorities[parent]:
+                break
+            self._move(self.items[parent], self.priorities[parent], i)
+            i = parent
+        self._move(item, priority, i)
+
+    def _sift_down(self, i):
+        """Move the entry at slot i down while a child is smaller (like heapify)."""
+        n = len(self.items)
+        item, priority = self.items[i], self.priorities[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and self.priorities[child + 1] < self.priorities[child]:
+                child += 1
+            if not self.priorities[child] < priority:
+                break
+            self._move(self.items[child], self.priorities[child], i)
+            i = child
+        self._move(item, priority, i)
+
+    def push(self, item, priority):
+        """Add a new item with the given priority in O(log n)."""
+        if item in self.position:
+            raise ValueError(f"item {item!r} is already queued")
+        self.items.append(item)
+        self.priorities.append(priority)
+        self.position[item] = len(self.items) - 1
+        self._sift_up(len(self.items) - 1)
+
+    def peek(self):
+        """Return the (item, priority) pair with the smallest priority."""
+        if not self.items:
+            raise IndexError("peek from an empty heap")
+        return self.items[0], self.priorities[0]
+
+    def pop(self):
+        """Remove and return the (item, priority) pair with the smallest priority."""
+        if not self.items:
+            raise IndexError("pop from an empty heap")
+        top = self.items[0], self.priorities[0]
+        del self.position[top[0]]
+        last_item, last_priority = self.items.pop(), self.priorities.pop()
+        if self.items:
+            self._move(last_item, last_priority, 0)
+            self._sift_down(0)
+        return top
+
+    def priority(self, item):
+        """Current priority of a queued item."""
+        return self.priorities[self.position[item]]
+
+    def update(self, item, priority):
+        """Change the priority of a queued item, moving it up or down as needed."""
+        i = self.position[item]  # KeyError if the item is not queued
+        old = self.priorities[i]
+        self.priorities[i] = priority
+        if priority < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def decrease_key(self, item, priority):
+        """Lower the priority of a queued item (moves it towards the top)."""
+        if self.priority(item) < priority:
+            raise ValueError("new priority is greater than the current one")
+        self.update(item, priority)
+
+    def increase_key(self, item, priority):
+        """Raise the priority of a queued item (moves it towards the leaves)."""
+        if priority < self.priority(item):
+            raise ValueError("new priority is smaller than the current one")
+        self.update(item, priority)
+
+
+class CompactHeap:
+    """
+    Min-Heap whose keys live in a typed array.array instead of a list of boxed
+    Python numbers: 8 bytes per key for "q" (int64) or "d" (float64), plus an
+    optional parallel array of payload ids. The sorted buffer can be handed
+    off as a memoryview without copying.
+    """
+    def __init__(self, keys=(), payloads=None, typecode="q", payload_typecode="q"):
+        """
+        Build the heap in O(n). An array.array with the right typecode is
+        adopted as storage without copying (the heap then owns it).
+        :param keys: initial keys
+        :param payloads: payload ids parallel to keys; pass an empty iterable to
+                         enable payloads on an empty heap, or None for keys only
+        :param typecode: array typecode of the keys ("q", "d", "i", "f", ...)
+        :param payload_typecode: array typecode of the payload ids
+        """
+        self.keys = self._as_array(keys, typecode)
+        self.payloads = None if payloads is None else self._as_array(payloads, payload_typecode)
+        if self.payloads is not None and len(self.payloads) != len(self.keys):
+            raise ValueError("keys and payloads must have the same length")
+        n = len(self.keys)
+        for i in range(n // 2 - 1, -1, -1):
+            self._sift_down(i, n)
+
+    @staticmethod
+    def _as_array(values, typecode):
+        if isinstance(values, array) and values.typecode == typecode:
+            return values
+        return array(typecode, values)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def nbytes(self):
+        """Memory used by the key and payload buffers."""
+        size = len(self.keys) * self.keys.itemsize
+        if self.payloads is not None:
+            size += len(self.payloads) * self.payloads.itemsize
+        return size
+
+    def _sift_down(self, i, n):
+        """Move keys[i] (and its payload) down within keys[:n] like min_heapify."""
+        keys, payloads = self.keys, self.payloads
+        key = keys[i]
+        payload = payloads[i] if payloads is not None else None
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if not keys[child] < key:
+                break
+            keys[i] = keys[child]
+            if payloads is not None:
+                payloads[i] = payloads[child]
+            i = child
+        keys[i] = key
+        if payloads is not None:
+            payloads[i] = payload
+
+    def _sift_up(self, i):
+        """Move keys[i] (and its payload) up while it is smaller than its parent."""
+        keys, payloads = self.keys, self.payloads
+        key = keys[i]
+        payload = payloads[i] if payloads is not None else None
+        while i > 0:
+            parent = (i - 1) // 2
+            if not key < keys[parent]:
+                break
+            keys[i] = keys[parent]
+            if payloads is not None:
+                payloads[i] = payloads[parent]
+            i = parent
+        keys[i] = key
+        if payloads is not None:
+            payloads[i] = payload
+
+    def push(self, key, payload=None):
+        """Add a key (and its payload id, if the heap stores payloads)."""
+        if (payload is None) != (self.payloads is None):
+            raise ValueError("payload must be given exactly when the heap stores payloads")
+        self.keys.append(key)
+        if self.payloads is not None:
+            self.payloads.append(payload)
+        self._sift_up(len(self.keys) - 1)
+
+    def peek(self):
+        """Return (key, payload) for the smallest key; payload is None without payloads."""
+        if not self.keys:
+            raise IndexError("peek from an empty heap")
+        return self.keys[0], (self.payloads[0] if self.payloads is not None else None)
+
+    def pop(self):
+        """Remove and return (key, payload) for the smallest key."""
+        top = self.peek()
+        last_key = self.keys.pop()
+        last_payload = self.payloads.pop() if self.payloads is not None else None
+        if self.keys:
+            self.keys[0] = last_key
+            if self.payloads is not None:
+                self.payloads[0] = last_payload
+            self._sift_down(0, len(self.keys))
+        return top
+
+    def drain_sorted(self):
+        """
+        Heap-sort the buffers in place and hand them off without copying.
+        The heap is left empty and no longer references the returned buffers.
+        :return: (keys, payloads) as memoryviews in ascending key order;
+                 payloads is None when the heap stores keys only
+        """
+        keys, payloads = self.keys, self.payloads
+        for i in range(len(keys) - 1, 0, -1):
+            # Move the current minimum behind the heap: gives descending order
+            keys[0], keys[i] = keys[i], keys[0]
+            if payloads is not None:
+                payloads[0], payloads[i] = payloads[i], payloads[0]
+            self._sift_down(0, i)
+        keys.reverse()
+        if payloads is not None:
+            payloads.reverse()
+
+        self.keys = array(keys.typecode)
+        self.payloads = None if payloads is None else array(payloads.typecode)
+        return memoryview(keys), (memoryview(payloads) if payloads is not None else None)
+
+
+class LockedHeapQueue:
+    """
+    Thread-safe priority queue for worker threads (smallest priority first).
+    All heap operations run under one lock; consumers blocked in get() sleep on
+    a condition variable and are woken by put(). Equal priorities are served
+    in FIFO order.
+    """
+    def __init__(self):
+        self._heap = []  # entries: (priority, sequence number, item)
+        self._seq = 0
+        self._not_empty = threading.Condition(threading.Lock())
+
+    def __len__(self):
+        with self._not_empty:
+            return len(self._heap)
+
+    def put(self, item, priority):
+        """Add an item; never blocks."""
+        with self._not_empty:
+            min_heap_push(self._heap, (priority, self._seq, item))
+            self._seq += 1
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return (item, priority) with the smallest priority.
+        :param block: wait for an item if the queue is empty
+        :param timeout: most seconds to wait (None waits forever)
+        :raises queue.Empty: nothing became available in time
+        """
+        with self._not_empty:
+            if not block:
+                if not self._heap:
+                    raise queue.Empty
+            elif timeout is None:
+                while not self._heap:
+                    self._not_empty.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while not self._heap:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                    self._not_empty.wait(remaining)
+            priority, _, item = min_heap_pop(self._heap)
+            return item, priority
+
+
+class AsyncHeapQueue:
+    """
+    asyncio priority queue (smallest priority first) for a single event loop.
+    A consumer awaiting get() on an empty queue parks on a future that the next
+    put resolves, so it never spins. Other threads should hand work over with
+    loop.call_soon_threadsafe(q.put_nowait, item, priority).
+    """
+    def __init__(self):
+        self._heap = []  # entries: (priority, sequence number, item)
+        self._seq = 0
+        self._getters = deque()  # futures of consumers waiting for an item
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _wakeup_next(self):
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                break
+
+    def put_nowait(self, item, priority):
+        """Add an item and wake one waiting consumer."""
+        min_heap_push(self._heap, (priority, self._seq, item))
+        self._seq += 1
+        self._wakeup_next()
+
+    async def put(self, item, priority):
+        """Add an item (the queue is unbounded, so this never waits)."""
+        self.put_nowait(item, priority)
+
+    def get_nowait(self):
+        """Return (item, priority) or raise asyncio.QueueEmpty."""
+        if not self._heap:
+            raise asyncio.QueueEmpty
+        priority, _, item = min_heap_pop(self._heap)
+        return item, priority
+
+    async def get(self, timeout=None):
+        """
+        Wait for and return (item, priority) with the smallest priority.
+        :param timeout: most seconds to wait (None waits forever)
+        :raises asyncio.TimeoutError: nothing became available in time
+        """
+        if timeout is not None:
+            return await asyncio.wait_for(self.get(), timeout)
+        while not self._heap:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                if getter in self._getters:
+                    self._getters.remove(getter)
+                elif self._heap:
+                    self._wakeup_next()  # pass our wake-up on to another consumer
+                raise
+        return self.get_nowait()
+
+
+def benchmark_queues(producers=4, consumers=4, items=100_000):
+    """
+    Throughput of LockedHeapQueue (threads) and AsyncHeapQueue (tasks) with
+    N producers and M consumers sharing one queue.
+    :param producers: number of producer threads / tasks
+    :param consumers: number of consumer threads / tasks
+    :param items: total items pushed through each queue
+    """
+    per_producer = items // producers
+    total = per_producer * producers
+    stop = float("inf")  # sentinel priority: sorts after every real item
+
+    q = LockedHeapQueue()
+
+    def produce(seed):
+        rng = random.Random(seed)
+        for n in range(per_producer):
+            q.put(n, rng.random())
+
+    def consume():
+        while q.get()[1] != stop:
+            pass
+
+    start = time.perf_counter()
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    producer_threads = [threading.Thread(target=produce, args=(i,)) for i in range(producers)]
+    for t in consumer_threads + producer_threads:
+        t.start()
+    for t in producer_threads:
+        t.join()
+    for _ in range(consumers):
+        q.put(None, stop)
+    for t in consumer_threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    print(f"LockedHeapQueue  {producers}P/{consumers}C: {total / elapsed:12,.0f} items/s")
+
+    async def run_async():
+        aq = AsyncHeapQueue()
+
+        async def produce_async(seed):
+            rng = random.Random(seed)
+            for n in range(per_producer):
+                await aq.put(n, rng.random())
+                if n % 100 == 0:
+                    await asyncio.sleep(0)  # let consumers interleave
+
+        async def consume_async():
+            while (await aq.get())[1] != stop:
+                pass
+
+        consumer_tasks = [asyncio.create_task(consume_async()) for _ in range(consumers)]
+        await asyncio.gather(*(produce_async(i) for i in range(producers)))
+        for _ in range(consumers):
+            aq.put_nowait(None, stop)
+        await asyncio.gather(*consumer_tasks)
+
+    start = time.perf_counter()
+    asyncio.run(run_async())
+    elapsed = time.perf_counter() - start
+    print(f"AsyncHeapQueue   {producers}P/{consumers}C: {total / elapsed:12,.0f} items/s")
+
+
 # -------------------------------------------------------------
 # Example Demonstration
 # -------------------------------------------------------------
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark_heap_sorts()
+        sys.exit()
+    if "--benchmark-queues" in sys.argv[1:]:
+        benchmark_queues()
+        sys.exit()
+
     arr = [45, 12, 89, 33, 25, 77, 5]
     print("Original Array:", arr)
-    sorted_arr = heap_sort(arr)
+    sorted_arr = heap_sort(arr, trace=print_trace)
+
+    deliveries = [45, 12, 89, 33, 25, 77, 5]
+    print("\n⚡ 3 fastest deliveries:", nsmallest(3, deliveries))
+    print("🐢 3 slowest deliveries:", nlargest(3, deliveries))
+
+    print("🌳 4-ary Heap Sort:", heap_sort_dary([45, 12, 89, 33, 25, 77, 5], d=4))
+
+    batch = CompactHeap([45, 12, 89, 33], payloads=[101, 102, 103, 104])
+    batch.push(5, 105)
+    sorted_keys, order_ids = batch.drain_sorted()
+    print("🧱 Compact heap:", sorted_keys.tolist(), "ids:", order_ids.tolist())
+
+    # Priority queue of jobs whose priorities change while they wait
+    jobs = IndexedHeap([("backup", 40), ("email", 10), ("report", 25)])
+    jobs.push("deploy", 30)
+    jobs.decrease_key("backup", 5)
+    print("\n📋 Job order:", [jobs.pop() for _ in range(len(jobs))])
 
 
 
@@ -1,10 +1,38 @@
+import heapq
+import itertools
+import os
+import tempfile
+from array import array, typecodes
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
-def merge_sort(orders):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; merge_sort_array falls back to pure Python
+    np = None
+
+# Below this many orders a process pool costs more than it saves
+PARALLEL_THRESHOLD = 200_000
+# Consecutive wins by one run before adaptive_merge_sort switches to galloping
+MIN_GALLOP = 7
+
+
+def merge_sort(orders, key=None, reverse=False):
     """
     Function to perform Merge Sort on a list of delivery times.
     :param orders: list of integers representing delivery times in minutes
+                   (or order records when a key function is given)
+    :param key: optional function extracting the sort key from each element
+    :param reverse: sort in descending order (equal keys keep their order)
     :return: sorted list of delivery times (ascending)
     """
+    if key is not None or reverse:
+        # Decorate-sort-undecorate: every key is computed exactly once
+        keys = [key(item) for item in orders] if key is not None else list(orders)
+        order = argsort(keys, reverse)
+        orders[:] = [orders[i] for i in order]
+        return orders
+
     if len(orders) > 1:
         mid = len(orders) // 2  # Divide array into two halves
         left_half = orders[:mid]
@@ -17,7 +45,7 @@ def merge_sort(orders):
         # Merge step
         i = j = k = 0
         while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
+            if left_half[i] <= right_half[j]:  # <= keeps equal times stable
                 orders[k] = left_half[i]
                 i += 1
             else:
@@ -39,6 +67,564 @@ def merge_sort(orders):
     return orders
 
 
+def merge(src, dst, lo, mid, hi):
+    """
+    Stable merge of the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    On equal delivery times the element from the left run is taken first.
+    """
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+
+    # Copy remaining elements (only one of the runs can have leftovers)
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+
+def merge_sort_bottom_up(orders):
+    """
+    Iterative (bottom-up) Merge Sort that allocates a single scratch buffer.
+    Runs of width 1, 2, 4, ... are merged back and forth between the list and
+    the buffer, so there is no slicing and no recursion depth limit.
+    :param orders: list of delivery times, sorted in place (stable)
+    :return: the same list, sorted ascending
+    """
+    n = len(orders)
+    src, dst = orders, [None] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge(src, dst, lo, mid, hi)
+        src, dst = dst, src  # ping-pong: merged output becomes next input
+        width *= 2
+
+    # After an odd number of passes the result lives in the scratch buffer
+    if src is not orders:
+        orders[:] = src
+    return orders
+
+
+def _merge_indices(keys, src, dst, lo, mid, hi, reverse):
+    """Stable merge of two runs of indices, comparing their keys."""
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if reverse:
+            take_left = keys[src[i]] >= keys[src[j]]
+        else:
+            take_left = keys[src[i]] <= keys[src[j]]
+        if take_left:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+    dst[k:hi] = src[i:mid] if i < mid else src[j:hi]
+
+
+def argsort(keys, reverse=False):
+    """
+    Stable bottom-up Merge Sort of the positions 0..n-1 by keys[position].
+    :param keys: sequence of sort keys (list, array.array, ...)
+    :param reverse: order the keys descending (ties keep their input order)
+    :return: list of indices such that [keys[i] for i in result] is sorted
+    """
+    n = len(keys)
+    src, dst = list(range(n)), [0] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge_indices(keys, src, dst, lo, mid, hi, reverse)
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def _apply_permutation(column, order):
+    """Rearrange a list or array.array in place so column[k] = old column[order[k]]."""
+    reordered = [column[i] for i in order]
+    if isinstance(column, array):
+        reordered = array(column.typecode, reordered)
+    column[:] = reordered
+
+
+def sort_columns(keys, *columns, reverse=False):
+    """
+    Sort parallel arrays (e.g. delivery times plus order ids) by the key column.
+    All columns are reordered in place with the same stable permutation, so no
+    per-order tuples are ever built.
+    :param keys: column holding the sort keys, e.g. delivery times
+    :param columns: other columns of the same length, e.g. order ids
+    :param reverse: sort in descending order of keys
+    :return: the permutation that was applied (original index of each row)
+    """
+    for column in columns:
+        if len(column) != len(keys):
+            raise ValueError("all columns must have the same length as keys")
+    order = argsort(keys, reverse)
+    for column in (keys,) + columns:
+        _apply_permutation(column, order)
+    return order
+
+
+def _shared_typecode(orders):
+    """array typecode for a shared-memory copy of orders, or None if unsupported."""
+    if all(type(t) is int for t in orders):
+        return "q"
+    if all(type(t) is float for t in orders):
+        return "d"
+    return None
+
+
+def _sort_shared_chunk(shm_name, typecode, lo, hi):
+    """Worker: sort the slice [lo:hi) of the shared buffer in place."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            chunk = merge_sort_bottom_up(view[lo:hi].tolist())
+            view[lo:hi] = array(typecode, chunk)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def parallel_merge_sort(orders, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Merge Sort that sorts chunks of the list on several CPU cores.
+    The delivery times are copied once into shared memory, each worker process
+    sorts its own chunk of that buffer in place, and the sorted chunks are then
+    k-way merged back into the list. Small inputs, a single worker, or values
+    that are not all int / all float use merge_sort_bottom_up instead.
+    :param orders: list of delivery times, sorted in place
+    :param workers: number of worker processes (default: all CPU cores)
+    :param threshold: minimum number of orders before the pool is used
+    :return: the same list, sorted ascending
+    """
+    n = len(orders)
+    workers = workers or os.cpu_count() or 1
+    # Fewer than 2 orders need no sorting (and would give empty chunks)
+    typecode = _shared_typecode(orders) if n >= max(threshold, 2) and workers > 1 else None
+    if typecode is None:
+        return merge_sort_bottom_up(orders)
+    try:
+        data = array(typecode, orders)
+    except OverflowError:  # integers that do not fit in 64 bits
+        return merge_sort_bottom_up(orders)
+
+    chunk_size = -(-n // workers)  # ceil(n / workers)
+    bounds = [(lo, min(lo + chunk_size, n)) for lo in range(0, n, chunk_size)]
+    shm = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+    try:
+        raw = shm.buf[:n * data.itemsize]
+        view = raw.cast(typecode)
+        try:
+            view[:] = data
+            del data
+            with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+                jobs = [pool.submit(_sort_shared_chunk, shm.name, typecode, lo, hi)
+                        for lo, hi in bounds]
+                for job in jobs:
+                    job.result()  # re-raise any worker error
+
+            runs = [view[lo:hi] for lo, hi in bounds]
+            try:
+                orders[:] = merge_streams(*runs)
+            finally:
+                for run in runs:
+                    run.release()
+        finally:
+            view.release()
+            raw.release()
+    finally:
+        shm.close()
+        shm.unlink()
+    return orders
+
+
+def _buffer_like(times, fmt, raw):
+    """Wrap sorted raw bytes in a new object of the same type as times."""
+    if isinstance(times, memoryview):
+        return memoryview(raw).cast(fmt)
+    return type(times)(raw)
+
+
+def merge_sort_array(times):
+    """
+    Function to sort numeric delivery times held in a typed array.
+    Accepts NumPy arrays, array.array, bytes/bytearray, memoryview and other
+    one-dimensional buffer-protocol objects. With NumPy installed the values are
+    sorted by its vectorized stable sort, otherwise by merge_sort_bottom_up.
+    Writable inputs are sorted in place and returned; read-only inputs (such as
+    bytes) are returned as a new sorted object of the same type.
+    :param times: array-like of integer or float delivery times
+    :return: the sorted delivery times, same type as the input
+    """
+    if np is not None and isinstance(times, np.ndarray):
+        if times.ndim != 1:
+            raise ValueError("only one-dimensional arrays can be sorted")
+        times.sort(kind="stable")
+        return times
+
+    view = memoryview(times)  # TypeError for objects without the buffer protocol
+    if view.ndim != 1:
+        raise ValueError("only one-dimensional buffers can be sorted")
+
+    if np is not None:
+        values = np.asarray(view)
+        if not view.readonly:
+            values.sort(kind="stable")  # sorts the caller's memory directly
+            return times
+        return _buffer_like(times, view.format, np.sort(values, kind="stable").tobytes())
+
+    typecode = view.format.lstrip("@")
+    if typecode not in typecodes:
+        raise ValueError(f"unsupported buffer format {view.format!r}")
+    ordered = array(typecode, merge_sort_bottom_up(view.tolist()))
+    if not view.readonly:
+        view[:] = ordered
+        return times
+    return _buffer_like(times, view.format, ordered.tobytes())
+
+
+def merge_streams(*feeds, key=None):
+    """
+    Lazily merge already sorted delivery feeds (one per warehouse) in order.
+    This is the merge step of Merge Sort generalised to N inputs: a min-heap
+    holds the current head of every feed, so memory is O(N) and each value is
+    yielded as soon as it is known to be the next smallest. Equal times are
+    yielded in feed order, so the merge is stable.
+    :param feeds: sorted iterables of delivery times (or records)
+    :param key: optional function extracting the sort key from each element
+    :return: generator of all elements in ascending order
+    """
+    heap = []  # entries: [key, feed index, value, iterator]
+    for index, feed in enumerate(feeds):
+        iterator = iter(feed)
+        for value in iterator:
+            heap.append([value if key is None else key(value), index, value, iterator])
+            break
+    heapq.heapify(heap)
+
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        for value in entry[3]:  # advance the feed that produced the smallest head
+            entry[0] = value if key is None else key(value)
+            entry[2] = value
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)  # that feed is exhausted
+
+    if heap:  # a single feed is left: pass the rest through untouched
+        _, _, value, iterator = heap[0]
+        yield value
+        yield from iterator
+
+
+class SortStats:
+    """Counters filled in by adaptive_merge_sort."""
+    def __init__(self):
+        self.runs = 0           # natural ascending/descending runs detected
+        self.comparisons = 0    # element comparisons performed
+
+    def __repr__(self):
+        return f"SortStats(runs={self.runs}, comparisons={self.comparisons})"
+
+
+def _min_run_length(n):
+    """Shortest run worth merging: n itself if small, else a value in [32, 64]."""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(a, lo, hi, stats):
+    """
+    Length of the natural run starting at a[lo]. A strictly descending run is
+    reversed in place (strict, so equal times never swap and sorting stays stable).
+    """
+    run_end = lo + 1
+    if run_end == hi:
+        return 1
+    stats.comparisons += 1
+    if a[run_end] < a[lo]:
+        run_end += 1
+        while run_end < hi:
+            stats.comparisons += 1
+            if not a[run_end] < a[run_end - 1]:
+                break
+            run_end += 1
+        a[lo:run_end] = a[lo:run_end][::-1]
+    else:
+        run_end += 1
+        while run_end < hi:
+            stats.comparisons += 1
+            if a[run_end] < a[run_end - 1]:
+                break
+            run_end += 1
+    return run_end - lo
+
+
+def _binary_insertion_sort(a, lo, hi, start, stats):
+    """Extend the sorted prefix a[lo:start] to a[lo:hi] by binary insertion."""
+    for i in range(start, hi):
+        item = a[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            stats.comparisons += 1
+            if item < a[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        a[left + 1:i + 1] = a[left:i]
+        a[left] = item
+
+
+def _gallop_right(key, a, lo, hi, stats):
+    """First index in the sorted slice a[lo:hi] holding a value greater than key."""
+    probe, step = lo, 1
+    while probe < hi:  # exponential search: probe lo, lo+2, lo+5, lo+10, ...
+        stats.comparisons += 1
+        if key < a[probe]:
+            break
+        lo = probe + 1
+        probe = lo + step
+        step *= 2
+    hi = min(probe, hi)
+    while lo < hi:     # binary search inside the bracketed range
+        mid = (lo + hi) // 2
+        stats.comparisons += 1
+        if key < a[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _gallop_left(key, a, lo, hi, stats):
+    """First index in the sorted slice a[lo:hi] holding a value not less than key."""
+    probe, step = lo, 1
+    while probe < hi:
+        stats.comparisons += 1
+        if not a[probe] < key:
+            break
+        lo = probe + 1
+        probe = lo + step
+        step *= 2
+    hi = min(probe, hi)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        stats.comparisons += 1
+        if a[mid] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _merge_galloping(a, lo, mid, hi, stats):
+    """Stable merge of the adjacent runs a[lo:mid] and a[mid:hi] with galloping."""
+    # Elements already in their final place need not be touched at all
+    lo = _gallop_right(a[mid], a, lo, mid, stats)
+    if lo == mid:
+        return
+    hi = _gallop_left(a[mid - 1], a, mid, hi, stats)
+
+    left = a[lo:mid]  # only the (trimmed) left run is copied out
+    i, j, k = 0, mid, lo
+    n_left = len(left)
+    while i < n_left and j < hi:
+        # One-at-a-time mode until one run wins MIN_GALLOP times in a row
+        wins_left = wins_right = 0
+        while i < n_left and j < hi:
+            stats.comparisons += 1
+            if a[j] < left[i]:
+                a[k] = a[j]
+                j += 1
+                wins_right += 1
+                wins_left = 0
+            else:
+                a[k] = left[i]
+                i += 1
+                wins_left += 1
+                wins_right = 0
+            k += 1
+            if wins_left >= MIN_GALLOP or wins_right >= MIN_GALLOP:
+                break
+
+        # Galloping mode: copy whole blocks found by exponential search
+        while i < n_left and j < hi:
+            end = _gallop_right(a[j], left, i, n_left, stats)
+            taken_left = end - i
+            a[k:k + taken_left] = left[i:end]
+            k += taken_left
+            i = end
+            if i == n_left:
+                break
+            end = _gallop_left(left[i], a, j, hi, stats)
+            taken_right = end - j
+            a[k:k + taken_right] = a[j:end]
+            k += taken_right
+            j = end
+            if taken_left < MIN_GALLOP and taken_right < MIN_GALLOP:
+                break
+
+    # Leftovers of the right run are already in place
+    a[k:k + n_left - i] = left[i:]
+
+
+def _merge_at(a, runs, i, stats):
+    """Merge the i-th and (i+1)-th pending runs on the stack."""
+    start, len_a = runs[i]
+    _, len_b = runs[i + 1]
+    _merge_galloping(a, start, start + len_a, start + len_a + len_b, stats)
+    runs[i:i + 2] = [(start, len_a + len_b)]
+
+
+def _merge_collapse(a, runs, stats):
+    """Merge pending runs until the run lengths shrink geometrically up the stack."""
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _merge_at(a, runs, n, stats)
+
+
+def adaptive_merge_sort(orders, stats=None):
+    """
+    Adaptive (TimSort-style) Merge Sort for mostly sorted delivery feeds.
+    Existing ascending and descending runs are detected and kept, short runs are
+    extended by binary insertion, and runs are merged with galloping, so nearly
+    sorted input is handled in close to O(n) comparisons.
+    :param orders: list of delivery times, sorted in place (stable)
+    :param stats: optional SortStats that receives run and comparison counts
+    :return: the same list, sorted ascending
+    """
+    if stats is None:
+        stats = SortStats()
+    n = len(orders)
+    min_run = _min_run_length(n)
+    runs = []  # stack of (start, length) of pending runs
+    lo = 0
+    while lo < n:
+        length = _count_run(orders, lo, n, stats)
+        stats.runs += 1
+        if length < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort(orders, lo, lo + forced, lo + length, stats)
+            length = forced
+        runs.append((lo, length))
+        lo += length
+        _merge_collapse(orders, runs, stats)
+
+    while len(runs) > 1:
+        _merge_at(orders, runs, len(runs) - 2, stats)
+    return orders
+
+
+def _read_times(stream):
+    """Yield delivery times (one integer per line) from an open text file."""
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield int(line)
+
+
+def _write_times(path, times):
+    """Write delivery times to `path`, one per line."""
+    with open(path, "w") as out:
+        out.writelines(f"{t}\n" for t in times)
+
+
+def _merge_run_files(run_paths, output_path):
+    """K-way merge already sorted run files into a single sorted file."""
+    run_files = [open(path) for path in run_paths]
+    try:
+        streams = [_read_times(f) for f in run_files]
+        _write_times(output_path, merge_streams(*streams))
+    finally:
+        for f in run_files:
+            f.close()
+
+
+def external_merge_sort(input_path, output_path, max_items_in_memory=1_000_000,
+                        max_open_runs=64, tmp_dir=None):
+    """
+    Function to sort a file of delivery times that is too large for memory.
+    The input is streamed in runs of at most max_items_in_memory values, each
+    run is sorted with merge_sort and spilled to a temporary file, and the runs
+    are k-way merged into the output file (in several passes if needed).
+    :param input_path: text file with one delivery time (minutes) per line
+    :param output_path: file that receives the sorted delivery times
+    :param max_items_in_memory: largest run that is held in memory at once
+    :param max_open_runs: most run files merged together in one pass
+    :param tmp_dir: directory for the temporary run files (system default if None)
+    :return: number of delivery times written
+    """
+    if max_items_in_memory < 1:
+        raise ValueError("max_items_in_memory must be at least 1")
+    if max_open_runs < 2:
+        raise ValueError("max_open_runs must be at least 2")
+
+    count = 0
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        # Phase 1: cut the input into sorted runs on disk
+        run_paths = []
+        with open(input_path) as source:
+            times = _read_times(source)
+            while True:
+                run = list(itertools.islice(times, max_items_in_memory))
+                if not run:
+                    break
+                count += len(run)
+                path = os.path.join(work_dir, f"run_{len(run_paths)}.txt")
+                _write_times(path, merge_sort(run))
+                run_paths.append(path)
+
+        # Phase 2: merge groups of runs until one pass can finish the job
+        pass_no = 0
+        while len(run_paths) > max_open_runs:
+            merged_paths = []
+            for start in range(0, len(run_paths), max_open_runs):
+                group = run_paths[start:start + max_open_runs]
+                path = os.path.join(work_dir, f"pass{pass_no}_{len(merged_paths)}.txt")
+                _merge_run_files(group, path)
+                for old in group:
+                    os.remove(old)
+                merged_paths.append(path)
+            run_paths = merged_paths
+            pass_no += 1
+
+        _merge_run_files(run_paths, output_path)
+    return count
+
+
 # ---------------------------------------------------------------
 # Example: Sorting Online Orders by Delivery Time
 # ---------------------------------------------------------------
@@ -49,6 +635,34 @@ if __name__ == "__main__":
     print("🚚 Online Orders - Delivery Times (Unsorted):", delivery_times)
     sorted_orders = merge_sort(delivery_times)
     print("✅ Online Orders Sorted by Delivery Time (Ascending):", sorted_orders)
+    print("🔁 Bottom-up Merge Sort:", merge_sort_bottom_up([45, 12, 30, 60, 25, 15, 10]))
+    print("⚙️ Parallel Merge Sort (2 workers):",
+          parallel_merge_sort([45, 12, 30, 60, 25, 15, 10], workers=2, threshold=1))
+
+    warehouse_feeds = [[10, 25, 60], [12, 15, 45], [30]]
+    print("🏭 Merged Warehouse Feeds:", list(merge_streams(*warehouse_feeds)))
+
+    feed = [10, 12, 15, 25, 30, 45, 60, 14, 5]  # sorted feed plus two late arrivals
+    feed_stats = SortStats()
+    print("📈 Adaptive Merge Sort:", adaptive_merge_sort(feed, feed_stats), feed_stats)
+    print("🔢 Typed Array Sort:", merge_sort_array(array("i", [45, 12, 30, 60, 25, 15, 10])))
+
+    # Sorting order records by delivery time, and the same data stored as columns
+    records = [("ORD-1", 45), ("ORD-2", 12), ("ORD-3", 30), ("ORD-4", 12)]
+    print("📦 Orders by Delivery Time:", merge_sort(records, key=lambda r: r[1]))
+    order_ids = ["ORD-1", "ORD-2", "ORD-3", "ORD-4"]
+    times = array("i", [45, 12, 30, 12])
+    sort_columns(times, order_ids, reverse=True)
+    print("📊 Columns, Slowest First:", order_ids, list(times))
+
+    # External sort: same data on disk, with a tiny memory budget to force spills
+    with tempfile.TemporaryDirectory() as demo_dir:
+        unsorted_path = os.path.join(demo_dir, "orders.txt")
+        sorted_path = os.path.join(demo_dir, "orders_sorted.txt")
+        _write_times(unsorted_path, [45, 12, 30, 60, 25, 15, 10])
+        external_merge_sort(unsorted_path, sorted_path, max_items_in_memory=3, max_open_runs=2)
+        with open(sorted_path) as f:
+            print("💾 External Merge Sort (3 orders in memory):", list(_read_times(f)))
 
 
 